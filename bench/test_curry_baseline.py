@@ -1,11 +1,25 @@
 from toolz import get
 from functools import partial
+from operator import itemgetter
 
 
-pairs = [(1, 2) for i in range(100000)]
+pairs = [(1, 2)] * 100000
 
 
 def test_get():
     first = partial(get, 0)
     for p in pairs:
         first(p)
+
+
+def test_get_itemgetter():
+    first = itemgetter(0)
+    for p in pairs:
+        first(p)
+
+
+def test_get_lambda():
+    # A lambda still pushes a Python frame per call
+    first = lambda p: p[0]
+    for p in pairs:
+        first(p)
@@ -1,34 +1,98 @@
 from toolz.curried import *
 
-try:
-    xrange
-except NameError:
-    xrange = range
 
 def burn(seq):
     for item in seq:
         pass
 
 
+def probe(index, rightseq):
+    """ Inner join ``rightseq`` (keyed by identity) against a prebuilt index
+
+    ``index`` is the ``groupby`` of the left sequence, so it is built once and
+    reused across calls instead of being rebuilt inside every ``join``.
+    """
+    for item in rightseq:
+        for left_match in index.get(item, ()):
+            yield (left_match, item)
+
+
+def dense_index(seq):
+    """ Direct-mapped ``groupby(identity, seq)`` for small dense int ranges
+
+    Returns ``(offset, buckets)`` where ``buckets[k - offset]`` holds the
+    matches for key ``k``, or ``None`` when the keys are not dense enough.
+    """
+    lo, hi = min(seq), max(seq)
+    if hi - lo >= 1 << 20:
+        return None
+    buckets = [()] * (hi - lo + 1)
+    for item in seq:
+        buckets[item - lo] += (item,)
+    return lo, buckets
+
+
+def probe_dense(index, rightseq):
+    lo, buckets = index
+    size = len(buckets)
+    for item in rightseq:
+        i = item - lo
+        if 0 <= i < size:
+            for left_match in buckets[i]:
+                yield (left_match, item)
+
+
 small = [(i, str(i)) for i in range(100)] * 10
-big = pipe([110]*10000, map(range), concat, list)
+big = list(range(110)) * 10000
 
 
 def test_many_to_many_large():
     burn(join(get(0), small, identity, big))
 
 
+def test_many_to_many_large_prebuilt():
+    index = groupby(get(0), small)
+    burn(probe(index, big))
+
+
 def test_one_to_one_tiny():
     A = list(range(20))
     B = A[::2] + A[1::2][::-1]
 
-    for i in xrange(50000):
+    for i in range(50000):
         burn(join(identity, A, identity, B))
 
 
+def test_one_to_one_tiny_prebuilt():
+    A = list(range(20))
+    B = A[::2] + A[1::2][::-1]
+    index = groupby(identity, A)
+
+    for i in range(50000):
+        burn(probe(index, B))
+
+
+def test_one_to_one_tiny_dense():
+    A = list(range(20))
+    B = A[::2] + A[1::2][::-1]
+    index = dense_index(A)
+
+    for i in range(50000):
+        burn(probe_dense(index, B))
+
+
 def test_one_to_many():
     A = list(range(20))
-    B = pipe([20]*1000, map(range), concat, list)
+    B = list(range(20)) * 1000
 
-    for i in xrange(100):
+    for i in range(100):
         burn(join(identity, A, identity, B))
+
+
+def test_many_to_one():
+    # Same data as test_one_to_many with the large side hashed instead
+    A = list(range(20))
+    B = list(range(20)) * 1000
+
+    for i in range(100):
+        burn(join(identity, B, identity, A))
@@ -2,7 +2,8 @@ from toolz import memoize
 
 
 def test_memoize_no_kwargs():
-    @memoize
+    # Unary functions are keyed on the bare argument
+    @memoize(cache={3: 3})
     def f(x):
         return x
 
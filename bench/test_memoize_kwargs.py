@@ -2,7 +2,8 @@ from toolz import memoize
 
 
 def test_memoize_kwargs():
-    @memoize
+    # Functions with keywords are keyed on (args, frozenset(kwargs))
+    @memoize(cache={((3,), None): 3})
     def f(x, y=3):
         return x
 
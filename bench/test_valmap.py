@@ -0,0 +1,14 @@
+from operator import neg
+
+from toolz import valmap
+
+
+numeric = dict(zip(range(100000), range(100000)))
+
+
+def test_valmap_numeric():
+    valmap(neg, numeric)
+
+
+def test_valmap_numeric_lambda():
+    valmap(lambda x: x * 2 + 1, numeric)
@@ -29,6 +29,15 @@ class TlzLoader:
             raise ImportError(fullname)
         return rv
 
+    def _forward_getattr(self, module, fast_mod):
+        def __getattr__(name):
+            try:
+                return getattr(fast_mod, name)
+            except AttributeError:
+                raise AttributeError('module %r has no attribute %r'
+                                     % (module.__name__, name)) from None
+        return __getattr__
+
     def find_module(self, fullname, path=None):  # pragma: py3 no cover
         package, dot, submodules = fullname.partition('.')
         if package == 'tlz':
@@ -55,7 +64,12 @@ class TlzLoader:
         toolz_mods = self._load_toolz(module.__name__)
         fast_mod = toolz_mods.get('cytoolz') or toolz_mods['toolz']
         slow_mod = toolz_mods.get('toolz') or toolz_mods['cytoolz']
-        module.__dict__.update(toolz.merge(fast_mod.__dict__, module.__dict__))
+        namespace = dict(fast_mod.__dict__)
+        namespace.update(module.__dict__)
+        module.__dict__.update(namespace)
+        if '__getattr__' in fast_mod.__dict__:
+            # Report missing names against ``tlz`` rather than ``toolz``
+            module.__getattr__ = self._forward_getattr(module, fast_mod)
         package = fast_mod.__package__
         if package is not None:
             package, dot, submodules = package.partition('.')
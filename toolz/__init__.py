@@ -21,6 +21,12 @@ from . import curried, sandbox
 
 functoolz._sigs.create_signature_registry()
 
-from ._version import get_versions
-__version__ = get_versions()['version']
-del get_versions
+
+def __getattr__(name):
+    # ``_version`` may shell out to git, so only load it when asked
+    if name == '__version__':
+        from ._version import get_versions
+        global __version__
+        __version__ = get_versions()['version']
+        return __version__
+    raise AttributeError("module 'toolz' has no attribute %r" % name)
@@ -50,20 +50,12 @@ module_info[builtins] = dict(
         lambda aiterator, default: None],
     any=[
         lambda iterable: None],
-    apply=[
-        lambda object: None,
-        lambda object, args: None,
-        lambda object, args, kwargs: None],
     ascii=[
         lambda obj: None],
     bin=[
         lambda number: None],
     bool=[
         lambda x=False: None],
-    buffer=[
-        lambda object: None,
-        lambda object, offset: None,
-        lambda object, offset, size: None],
     bytearray=[
         lambda: None,
         lambda int: None,
@@ -74,10 +66,6 @@ module_info[builtins] = dict(
         lambda i: None],
     classmethod=[
         lambda function: None],
-    cmp=[
-        lambda x, y: None],
-    coerce=[
-        lambda x, y: None],
     complex=[
         lambda real=0, imag=0: None],
     delattr=[
@@ -96,12 +84,6 @@ module_info[builtins] = dict(
         lambda source: None,
         lambda source, globals: None,
         lambda source, globals, locals: None],
-    execfile=[
-        lambda filename: None,
-        lambda filename, globals: None,
-        lambda filename, globals, locals: None],
-    file=[
-        (0, lambda name, mode='r', buffering=-1: None)],
     filter=[
         lambda function, iterable: None],
     float=[
@@ -131,8 +113,6 @@ module_info[builtins] = dict(
     int=[
         lambda x=0: None,
         (0, lambda x, base=10: None)],
-    intern=[
-        lambda string: None],
     isinstance=[
         lambda obj, class_or_tuple: None],
     issubclass=[
@@ -147,9 +127,6 @@ module_info[builtins] = dict(
         lambda iterable: None],
     locals=[
         lambda: None],
-    long=[
-        lambda x=0: None,
-        (0, lambda x, base=10: None)],
     map=[
         lambda func, sequence, *iterables: None],
     memoryview=[
@@ -172,14 +149,6 @@ module_info[builtins] = dict(
         lambda stop: None,
         lambda start, stop: None,
         lambda start, stop, step: None],
-    raw_input=[
-        lambda: None,
-        lambda prompt: None],
-    reduce=[
-        lambda function, sequence: None,
-        lambda function, sequence, initial: None],
-    reload=[
-        lambda module: None],
     repr=[
         lambda obj: None],
     reversed=[
@@ -209,18 +178,9 @@ module_info[builtins] = dict(
     type=[
         lambda object: None,
         lambda name, bases, dict: None],
-    unichr=[
-        lambda i: None],
-    unicode=[
-        lambda object: None,
-        lambda string='', encoding='utf8', errors='strict': None],
     vars=[
         lambda: None,
         lambda object: None],
-    xrange=[
-        lambda stop: None,
-        lambda start, stop: None,
-        lambda start, stop, step: None],
     zip=[
         lambda *iterables: None],
     __build_class__=[
@@ -295,20 +255,10 @@ module_info[itertools] = dict(
         lambda function, sequence: None],
     groupby=[
         (0, lambda iterable, key=None: None)],
-    ifilter=[
-        lambda function, sequence: None],
-    ifilterfalse=[
-        lambda function, sequence: None],
-    imap=[
-        lambda func, sequence, *iterables: None],
     islice=[
         lambda iterable, stop: None,
         lambda iterable, start, stop: None,
         lambda iterable, start, stop, step: None],
-    izip=[
-        lambda *iterables: None],
-    izip_longest=[
-        (0, lambda *iterables: None, ('fillvalue',))],
     pairwise=[
         lambda iterable: None],
     permutations=[
@@ -342,10 +292,6 @@ module_info[operator] = dict(
         lambda a, b: None],
     __delitem__=[
         lambda a, b: None],
-    __delslice__=[
-        lambda a, b, c: None],
-    __div__=[
-        lambda a, b: None],
     __eq__=[
         lambda a, b: None],
     __floordiv__=[
@@ -354,8 +300,6 @@ module_info[operator] = dict(
         lambda a, b: None],
     __getitem__=[
         lambda a, b: None],
-    __getslice__=[
-        lambda a, b, c: None],
     __gt__=[
         lambda a, b: None],
     __iadd__=[
@@ -364,8 +308,6 @@ module_info[operator] = dict(
         lambda a, b: None],
     __iconcat__=[
         lambda a, b: None],
-    __idiv__=[
-        lambda a, b: None],
     __ifloordiv__=[
         lambda a, b: None],
     __ilshift__=[
@@ -386,8 +328,6 @@ module_info[operator] = dict(
         lambda a, b: None],
     __ipow__=[
         lambda a, b: None],
-    __irepeat__=[
-        lambda a, b: None],
     __irshift__=[
         lambda a, b: None],
     __isub__=[
@@ -420,14 +360,10 @@ module_info[operator] = dict(
         lambda a: None],
     __pow__=[
         lambda a, b: None],
-    __repeat__=[
-        lambda a, b: None],
     __rshift__=[
         lambda a, b: None],
     __setitem__=[
         lambda a, b, c: None],
-    __setslice__=[
-        lambda a, b, c, d: None],
     __sub__=[
         lambda a, b: None],
     __truediv__=[
@@ -454,10 +390,6 @@ module_info[operator] = dict(
         lambda a, b: None],
     delitem=[
         lambda a, b: None],
-    delslice=[
-        lambda a, b, c: None],
-    div=[
-        lambda a, b: None],
     eq=[
         lambda a, b: None],
     floordiv=[
@@ -466,8 +398,6 @@ module_info[operator] = dict(
         lambda a, b: None],
     getitem=[
         lambda a, b: None],
-    getslice=[
-        lambda a, b, c: None],
     gt=[
         lambda a, b: None],
     iadd=[
@@ -476,8 +406,6 @@ module_info[operator] = dict(
         lambda a, b: None],
     iconcat=[
         lambda a, b: None],
-    idiv=[
-        lambda a, b: None],
     ifloordiv=[
         lambda a, b: None],
     ilshift=[
@@ -500,22 +428,12 @@ module_info[operator] = dict(
         lambda a, b: None],
     ipow=[
         lambda a, b: None],
-    irepeat=[
-        lambda a, b: None],
     irshift=[
         lambda a, b: None],
     is_=[
         lambda a, b: None],
     is_not=[
         lambda a, b: None],
-    isCallable=[
-        lambda a: None],
-    isMappingType=[
-        lambda a: None],
-    isNumberType=[
-        lambda a: None],
-    isSequenceType=[
-        lambda a: None],
     isub=[
         lambda a, b: None],
     itemgetter=[
@@ -553,16 +471,10 @@ module_info[operator] = dict(
         lambda a: None],
     pow=[
         lambda a, b: None],
-    repeat=[
-        lambda a, b: None],
     rshift=[
         lambda a, b: None],
-    sequenceIncludes=[
-        lambda a, b: None],
     setitem=[
         lambda a, b, c: None],
-    setslice=[
-        lambda a, b, c, d: None],
     sub=[
         lambda a, b: None],
     truediv=[
@@ -5,7 +5,6 @@ warnings.warn("The toolz.compatibility module is no longer "
               "This module will be removed in a future release.",
               category=DeprecationWarning, stacklevel=2)
 
-import operator
 import sys
 
 PY3 = sys.version_info[0] > 2
@@ -24,7 +23,18 @@ zip = zip
 from functools import reduce
 from itertools import zip_longest
 from itertools import filterfalse
-iteritems = operator.methodcaller('items')
-iterkeys = operator.methodcaller('keys')
-itervalues = operator.methodcaller('values')
+
+
+def iteritems(d):
+    return d.items()
+
+
+def iterkeys(d):
+    return d.keys()
+
+
+def itervalues(d):
+    return d.values()
+
+
 from collections.abc import Sequence
@@ -1,12 +1,16 @@
-import operator
-import collections
-from functools import reduce
+import sys
 from collections.abc import Mapping
 
 __all__ = ('merge', 'merge_with', 'valmap', 'keymap', 'itemmap',
            'valfilter', 'keyfilter', 'itemfilter',
            'assoc', 'dissoc', 'assoc_in', 'update_in', 'get_in')
 
+# PEP 584 in-place dict union
+_DICT_IOR = sys.version_info >= (3, 9)
+
+# ``dict`` is listed first so plain dicts skip the slower ABC check
+_mappings = (dict, Mapping)
+
 
 def _get_factory(f, kwargs):
     factory = kwargs.pop('factory', dict)
@@ -30,13 +34,36 @@ def merge(*dicts, **kwargs):
     See Also:
         merge_with
     """
-    if len(dicts) == 1 and not isinstance(dicts[0], Mapping):
+    if not kwargs:
+        # Short calls on plain dicts merge in a single C-level step
+        if len(dicts) == 2:
+            a, b = dicts
+            if type(a) is dict and type(b) is dict:
+                return {**a, **b}
+        elif len(dicts) == 1:
+            if type(dicts[0]) is dict:
+                return dicts[0].copy()
+        elif not dicts:
+            return {}
+    if len(dicts) == 1 and not isinstance(dicts[0], _mappings):
         dicts = dicts[0]
     factory = _get_factory(merge, kwargs)
 
-    rv = factory()
+    if factory is dict:
+        # Copying the first dict sizes the result in one step instead of
+        # growing an empty dict through repeated resizes
+        dicts = iter(dicts)
+        rv = dict(next(dicts, ()))
+        if _DICT_IOR:
+            # ``|=`` merges without looking up or calling a bound method
+            for d in dicts:
+                rv |= d
+            return rv
+    else:
+        rv = factory()
+    update = rv.update
     for d in dicts:
-        rv.update(d)
+        update(d)
     return rv
 
 
@@ -55,18 +82,33 @@ def merge_with(func, *dicts, **kwargs):
     See Also:
         merge
     """
-    if len(dicts) == 1 and not isinstance(dicts[0], Mapping):
+    if len(dicts) == 1 and not isinstance(dicts[0], _mappings):
         dicts = dicts[0]
     factory = _get_factory(merge_with, kwargs)
 
-    values = collections.defaultdict(lambda: [].append)
+    if func is min or func is max:
+        # ``min``/``max`` of a list equals folding them pairwise, so fold
+        # values as they arrive and keep only one value per key.  ``sum`` is
+        # left out: it starts from ``0`` and may compensate float rounding.
+        result = factory()
+        for d in dicts:
+            for k, v in d.items():
+                result[k] = func(result[k], v) if k in result else v
+        return result
+
+    values = {}
     for d in dicts:
         for k, v in d.items():
-            values[k](v)
+            values.setdefault(k, []).append(v)
 
+    if factory is dict:
+        # ``values`` is ours, so reuse its table instead of building another
+        for k, v in values.items():
+            values[k] = func(v)
+        return values
     result = factory()
     for k, v in values.items():
-        result[k] = func(v.__self__)
+        result[k] = func(v)
     return result
 
 
@@ -81,6 +123,8 @@ def valmap(func, d, factory=dict):
         keymap
         itemmap
     """
+    if factory is dict:
+        return {k: func(v) for k, v in d.items()}
     rv = factory()
     rv.update(zip(d.keys(), map(func, d.values())))
     return rv
@@ -97,6 +141,8 @@ def keymap(func, d, factory=dict):
         valmap
         itemmap
     """
+    if factory is dict:
+        return {func(k): v for k, v in d.items()}
     rv = factory()
     rv.update(zip(map(func, d.keys()), d.values()))
     return rv
@@ -109,10 +155,19 @@ def itemmap(func, d, factory=dict):
     >>> itemmap(reversed, accountids)  # doctest: +SKIP
     {10: "Alice", 20: "Bob"}
 
+    Changing keys and values together takes one pass over the dictionary,
+    where ``valmap(sum, keymap(str.lower, bills))`` would take two
+
+    >>> bills = {"Alice": [20, 15, 30], "Bob": [10, 35]}
+    >>> itemmap(lambda kv: (kv[0].lower(), sum(kv[1])), bills)
+    {'alice': 65, 'bob': 45}
+
     See Also:
         keymap
         valmap
     """
+    if factory is dict:
+        return dict(map(func, d.items()))
     rv = factory()
     rv.update(map(func, d.items()))
     return rv
@@ -131,6 +186,8 @@ def valfilter(predicate, d, factory=dict):
         itemfilter
         valmap
     """
+    if factory is dict:
+        return {k: v for k, v in d.items() if predicate(v)}
     rv = factory()
     for k, v in d.items():
         if predicate(v):
@@ -151,6 +208,8 @@ def keyfilter(predicate, d, factory=dict):
         itemfilter
         keymap
     """
+    if factory is dict:
+        return {k: v for k, v in d.items() if predicate(k)}
     rv = factory()
     for k, v in d.items():
         if predicate(k):
@@ -174,11 +233,10 @@ def itemfilter(predicate, d, factory=dict):
         valfilter
         itemmap
     """
+    if factory is dict:
+        return dict(filter(predicate, d.items()))
     rv = factory()
-    for item in d.items():
-        if predicate(item):
-            k, v = item
-            rv[k] = v
+    rv.update(filter(predicate, d.items()))
     return rv
 
 
@@ -192,8 +250,11 @@ def assoc(d, key, value, factory=dict):
     >>> assoc({'x': 1}, 'y', 3)   # doctest: +SKIP
     {'x': 1, 'y': 3}
     """
-    d2 = factory()
-    d2.update(d)
+    if factory is dict:
+        d2 = dict(d)
+    else:
+        d2 = factory()
+        d2.update(d)
     d2[key] = value
     return d2
 
@@ -212,21 +273,65 @@ def dissoc(d, *keys, **kwargs):
     {'x': 1}
     """
     factory = _get_factory(dissoc, kwargs)
-    d2 = factory()
 
     if len(keys) < len(d) * .6:
-        d2.update(d)
+        if factory is dict:
+            d2 = dict(d)
+        else:
+            d2 = factory()
+            d2.update(d)
         for key in keys:
             if key in d2:
                 del d2[key]
-    else:
-        remaining = set(d)
-        remaining.difference_update(keys)
-        for k in remaining:
-            d2[k] = d[k]
+        return d2
+
+    remaining = set(d)
+    remaining.difference_update(keys)
+    if factory is dict:
+        # None of ``keys`` were present: a straight copy beats a rebuild
+        if len(remaining) == len(d):
+            return dict(d)
+        return {k: d[k] for k in remaining}
+    d2 = factory()
+    for k in remaining:
+        d2[k] = d[k]
     return d2
 
 
+def _copy_path(d, keys, factory):
+    """ Copy the dictionaries along ``keys`` for ``assoc_in`` and ``update_in``
+
+    Returns ``(rv, inner, d, k)``: the new outer dictionary, the copy that
+    will hold the last key ``k``, and the original dictionary at that level.
+    Missing levels are created with ``factory``.
+    """
+    ks = iter(keys)
+    k = next(ks)
+
+    # ``dict(d)`` copies into a table sized for ``d`` up front
+    if factory is dict:
+        rv = inner = dict(d)
+    else:
+        rv = inner = factory()
+        rv.update(d)
+
+    for key in ks:
+        if k in d:
+            d = d[k]
+            if factory is dict:
+                dtemp = dict(d)
+            else:
+                dtemp = factory()
+                dtemp.update(d)
+        else:
+            d = dtemp = factory()
+
+        inner[k] = inner = dtemp
+        k = key
+
+    return rv, inner, d, k
+
+
 def assoc_in(d, keys, value, factory=dict):
     """ Return a new dict with new, potentially nested, key value pair
 
@@ -239,7 +344,9 @@ def assoc_in(d, keys, value, factory=dict):
      'name': 'Alice',
      'order': {'costs': [0.25, 1.00], 'items': ['Apple', 'Orange']}}
     """
-    return update_in(d, keys, lambda x: value, value, factory)
+    rv, inner, d, k = _copy_path(d, keys, factory)
+    inner[k] = value
+    return rv
 
 
 def update_in(d, keys, func, default=None, factory=dict):
@@ -276,23 +383,7 @@ def update_in(d, keys, func, default=None, factory=dict):
     >>> update_in({1: 'foo'}, [2, 3, 4], inc, 0)
     {1: 'foo', 2: {3: {4: 1}}}
     """
-    ks = iter(keys)
-    k = next(ks)
-
-    rv = inner = factory()
-    rv.update(d)
-
-    for key in ks:
-        if k in d:
-            d = d[k]
-            dtemp = factory()
-            dtemp.update(d)
-        else:
-            d = dtemp = factory()
-
-        inner[k] = inner = dtemp
-        k = key
-
+    rv, inner, d, k = _copy_path(d, keys, factory)
     if k in d:
         inner[k] = func(d[k])
     else:
@@ -332,7 +423,9 @@ def get_in(keys, coll, default=None, no_default=False):
         operator.getitem
     """
     try:
-        return reduce(operator.getitem, keys, coll)
+        for k in keys:
+            coll = coll[k]
+        return coll
     except (KeyError, IndexError, TypeError):
         if no_default:
             raise
@@ -1,14 +1,12 @@
-from functools import reduce, partial
+from functools import partial
 import inspect
 import sys
 from operator import attrgetter, not_
 from importlib import import_module
-from types import MethodType
+from types import FunctionType, MethodType
 
 from .utils import no_default
 
-PYPY = hasattr(sys, 'pypy_version_info') and sys.version_info[0] > 2
-
 
 __all__ = ('identity', 'apply', 'thread_first', 'thread_last', 'memoize',
            'compose', 'compose_left', 'pipe', 'complement', 'juxt', 'do',
@@ -16,6 +14,14 @@ __all__ = ('identity', 'apply', 'thread_first', 'thread_last', 'memoize',
 
 PYPY = hasattr(sys, 'pypy_version_info')
 
+# Bound once for the parameter loops of the introspection functions below
+_empty = inspect.Parameter.empty
+_VAR_POSITIONAL = inspect.Parameter.VAR_POSITIONAL
+_POSITIONAL_KINDS = frozenset([inspect.Parameter.POSITIONAL_ONLY,
+                               inspect.Parameter.POSITIONAL_OR_KEYWORD])
+_KEYWORD_KINDS = frozenset([inspect.Parameter.KEYWORD_ONLY,
+                            inspect.Parameter.VAR_KEYWORD])
+
 
 def identity(x):
     """ Identity function. Return x
@@ -67,14 +73,14 @@ def thread_first(val, *forms):
     See Also:
         thread_last
     """
-    def evalform_front(val, form):
+    for form in forms:
         if callable(form):
-            return form(val)
-        if isinstance(form, tuple):
-            func, args = form[0], form[1:]
-            args = (val,) + args
-            return func(*args)
-    return reduce(evalform_front, forms, val)
+            val = form(val)
+        elif isinstance(form, tuple):
+            val = form[0](val, *form[1:])
+        else:
+            val = None
+    return val
 
 
 def thread_last(val, *forms):
@@ -106,14 +112,14 @@ def thread_last(val, *forms):
     See Also:
         thread_first
     """
-    def evalform_back(val, form):
+    for form in forms:
         if callable(form):
-            return form(val)
-        if isinstance(form, tuple):
-            func, args = form[0], form[1:]
-            args = args + (val,)
-            return func(*args)
-    return reduce(evalform_back, forms, val)
+            val = form(val)
+        elif isinstance(form, tuple):
+            val = form[0](*form[1:], val)
+        else:
+            val = None
+    return val
 
 
 def instanceproperty(fget=None, fset=None, fdel=None, doc=None, classval=None):
@@ -165,6 +171,19 @@ class InstanceProperty(property):
         return InstanceProperty, state
 
 
+def _positional_required(func, sigspec):
+    """ Number of required arguments if ``sigspec`` has only positional
+    parameters, otherwise None """
+    if not isinstance(sigspec, inspect.Signature):
+        return None
+    if PYPY and func in _sigs.signatures:  # pragma: no cover
+        return None
+    params = sigspec.parameters.values()
+    if any(p.kind not in _POSITIONAL_KINDS for p in params):
+        return None
+    return sum(p.default is _empty for p in params)
+
+
 class curry(object):
     """ Curry a callable function
 
@@ -200,8 +219,18 @@ class curry(object):
         if not callable(func):
             raise TypeError("Input must be callable")
 
+        if isinstance(func, curry):
+            # The underlying function is unchanged, so reuse its introspection
+            self._sigspec = func._sigspec
+            self._has_unknown_args = func._has_unknown_args
+            self._nrequired = func._nrequired
+        else:
+            self._sigspec = None
+            self._has_unknown_args = None
+            self._nrequired = None
+
         # curry- or functools.partial-like object?  Unpack and merge arguments
-        if (
+        if isinstance(func, (curry, partial)) or (
             hasattr(func, 'func')
             and hasattr(func, 'args')
             and hasattr(func, 'keywords')
@@ -219,13 +248,12 @@ class curry(object):
             self._partial = partial(func, *args, **kwargs)
         else:
             self._partial = partial(func, *args)
+        self._signature = None
 
         self.__doc__ = getattr(func, '__doc__', None)
         self.__name__ = getattr(func, '__name__', '<curry>')
         self.__module__ = getattr(func, '__module__', None)
         self.__qualname__ = getattr(func, '__qualname__', None)
-        self._sigspec = None
-        self._has_unknown_args = None
 
     @instanceproperty
     def func(self):
@@ -233,6 +261,10 @@ class curry(object):
 
     @instanceproperty
     def __signature__(self):
+        # ``args`` and ``keywords`` are fixed for an instance (``bind``
+        # returns a new curry), so the result can be computed once
+        if self._signature is not None:
+            return self._signature
         sig = inspect.signature(self.func)
         args = self.args or ()
         keywords = self.keywords or {}
@@ -267,7 +299,8 @@ class curry(object):
                     default = no_default
             newparams.append(param.replace(default=default, kind=kind))
 
-        return sig.replace(parameters=newparams)
+        self._signature = sig.replace(parameters=newparams)
+        return self._signature
 
     @instanceproperty
     def args(self):
@@ -315,10 +348,15 @@ class curry(object):
         if self._sigspec is None:
             sigspec = self._sigspec = _sigs.signature_or_spec(func)
             self._has_unknown_args = has_varargs(func, sigspec) is not False
+            self._nrequired = _positional_required(func, sigspec)
         else:
             sigspec = self._sigspec
 
-        if is_partial_args(func, args, kwargs, sigspec) is False:
+        if self._nrequired is not None and not kwargs:
+            # Only positional parameters: compare counts instead of binding
+            # the signature.  Too few arguments can be completed later.
+            return len(args) < self._nrequired
+        elif is_partial_args(func, args, kwargs, sigspec) is False:
             # Nothing can make the call valid
             return False
         elif self._has_unknown_args:
@@ -369,7 +407,8 @@ class curry(object):
 
         # functools.partial objects can't be pickled
         userdict = tuple((k, v) for k, v in self.__dict__.items()
-                         if k not in ('_partial', '_sigspec'))
+                         if k not in ('_partial', '_sigspec', '_signature',
+                                      '_has_unknown_args', '_nrequired'))
         state = (type(self), func, self.args, self.keywords, userdict,
                  is_decorated)
         return _restore_curry, state
@@ -437,29 +476,51 @@ def memoize(func, cache=None, key=None):
         may_have_kwargs = True
         is_unary = False
 
-    if key is None:
-        if is_unary:
-            def key(args, kwargs):
-                return args[0]
-        elif may_have_kwargs:
-            def key(args, kwargs):
-                return (
-                    args or None,
-                    frozenset(kwargs.items()) if kwargs else None,
-                )
-        else:
-            def key(args, kwargs):
-                return args
-
-    def memof(*args, **kwargs):
-        k = key(args, kwargs)
-        try:
-            return cache[k]
-        except TypeError:
-            raise TypeError("Arguments to memoized function must be hashable")
-        except KeyError:
-            cache[k] = result = func(*args, **kwargs)
-            return result
+    # The default keys are computed inline to avoid an extra function call
+    # on every cache hit.
+    if key is not None:
+        def memof(*args, **kwargs):
+            k = key(args, kwargs)
+            try:
+                return cache[k]
+            except TypeError:
+                raise TypeError("Arguments to memoized function must be "
+                                "hashable")
+            except KeyError:
+                cache[k] = result = func(*args, **kwargs)
+                return result
+    elif is_unary:
+        # Taking the one argument directly skips packing an args tuple
+        def memof(arg):
+            try:
+                return cache[arg]
+            except TypeError:
+                raise TypeError("Arguments to memoized function must be "
+                                "hashable")
+            except KeyError:
+                cache[arg] = result = func(arg)
+                return result
+    elif may_have_kwargs:
+        def memof(*args, **kwargs):
+            k = (args or None, frozenset(kwargs.items()) if kwargs else None)
+            try:
+                return cache[k]
+            except TypeError:
+                raise TypeError("Arguments to memoized function must be "
+                                "hashable")
+            except KeyError:
+                cache[k] = result = func(*args, **kwargs)
+                return result
+    else:
+        def memof(*args, **kwargs):
+            try:
+                return cache[args]
+            except TypeError:
+                raise TypeError("Arguments to memoized function must be "
+                                "hashable")
+            except KeyError:
+                cache[args] = result = func(*args, **kwargs)
+                return result
 
     try:
         memof.__name__ = func.__name__
@@ -476,12 +537,22 @@ class Compose(object):
     See Also:
         compose
     """
-    __slots__ = 'first', 'funcs'
+    __slots__ = 'first', 'funcs', '_hash'
 
     def __init__(self, funcs):
-        funcs = tuple(reversed(funcs))
-        self.first = funcs[0]
-        self.funcs = funcs[1:]
+        funcs = tuple(funcs)
+        self.first = funcs[-1]
+        self.funcs = funcs[-2::-1]
+        self._hash = None
+
+    @classmethod
+    def _from_call_order(cls, first, funcs):
+        """ Build from ``first`` and the remaining ``funcs`` in call order """
+        self = cls.__new__(cls)
+        self.first = first
+        self.funcs = funcs
+        self._hash = None
+        return self
 
     def __call__(self, *args, **kwargs):
         ret = self.first(*args, **kwargs)
@@ -494,6 +565,7 @@ class Compose(object):
 
     def __setstate__(self, state):
         self.first, self.funcs = state
+        self._hash = None
 
     @instanceproperty(classval=__doc__)
     def __doc__(self):
@@ -538,7 +610,10 @@ class Compose(object):
         return NotImplemented if equality is NotImplemented else not equality
 
     def __hash__(self):
-        return hash(self.first) ^ hash(self.funcs)
+        # Computed on first use: the functions may not all be hashable
+        if self._hash is None:
+            self._hash = hash(self.first) ^ hash(self.funcs)
+        return self._hash
 
     # Mimic the descriptor behavior of python functions.
     # i.e. let Compose be called as a method when bound to a class.
@@ -601,7 +676,12 @@ def compose_left(*funcs):
         compose
         pipe
     """
-    return compose(*reversed(funcs))
+    if not funcs:
+        return identity
+    if len(funcs) == 1:
+        return funcs[0]
+    # Already in call order, so skip the reversal in ``Compose.__init__``
+    return Compose._from_call_order(funcs[0], funcs[1:])
 
 
 def pipe(data, *funcs):
@@ -669,7 +749,7 @@ class juxt(object):
         self.funcs = tuple(funcs)
 
     def __call__(self, *args, **kwargs):
-        return tuple(func(*args, **kwargs) for func in self.funcs)
+        return tuple([func(*args, **kwargs) for func in self.funcs])
 
     def __getstate__(self):
         return self.funcs
@@ -766,6 +846,8 @@ class excepts(object):
     >>> excepting({0: 1})
     1
     """
+    __slots__ = 'exc', 'func', 'handler'
+
     def __init__(self, exc, func, handler=return_none):
         self.exc = exc
         self.func = func
@@ -777,6 +859,15 @@ class excepts(object):
         except self.exc as e:
             return self.handler(e)
 
+    def __getstate__(self):
+        return self.exc, self.func, self.handler
+
+    def __setstate__(self, state):
+        if isinstance(state, dict):
+            # Pickled before ``excepts`` had ``__slots__``
+            state = state['exc'], state['func'], state['handler']
+        self.exc, self.func, self.handler = state
+
     @instanceproperty(classval=__doc__)
     def __doc__(self):
         from textwrap import dedent
@@ -833,10 +924,7 @@ def _check_sigspec(sigspec, func, builtin_func, *builtin_args):
     elif not isinstance(sigspec, inspect.Signature):
         if (
             func in _sigs.signatures
-            and ((
-                hasattr(func, '__signature__')
-                and hasattr(func.__signature__, '__get__')
-            ))
+            and hasattr(getattr(func, '__signature__', None), '__get__')
         ):
             val = builtin_func(*builtin_args)
             return None, val
@@ -858,35 +946,62 @@ if PYPY:  # pragma: no cover
 _check_sigspec.__doc__ = """ \
 Private function to aid in introspection compatibly across Python versions.
 
-If a callable doesn't have a signature (Python 3) or an argspec (Python 2),
-the signature registry in toolz._signatures is used.
+If a callable doesn't have a signature, the signature registry in
+toolz._signatures is used.
 """
 
 
+def _plain_code(func):
+    """ Return ``func.__code__`` if it fully describes the signature of func
+
+    Plain Python functions can be introspected from their code object, which
+    is much cheaper than building an ``inspect.Signature``.  Functions whose
+    signature is overridden via ``__signature__`` or ``__wrapped__`` (e.g. by
+    ``functools.wraps``) return None.
+    """
+    if type(func) is FunctionType:
+        fdict = func.__dict__
+        if ('__signature__' not in fdict and '__wrapped__' not in fdict
+                and func not in _sigs.signatures):
+            return func.__code__
+    return None
+
+
 def num_required_args(func, sigspec=None):
+    if sigspec is None:
+        code = _plain_code(func)
+        if code is not None:
+            return code.co_argcount - len(func.__defaults__ or ())
     sigspec, rv = _check_sigspec(sigspec, func, _sigs._num_required_args,
                                  func)
     if sigspec is None:
         return rv
     return sum(1 for p in sigspec.parameters.values()
-               if p.default is p.empty
-               and p.kind in (p.POSITIONAL_OR_KEYWORD, p.POSITIONAL_ONLY))
+               if p.default is _empty and p.kind in _POSITIONAL_KINDS)
 
 
 def has_varargs(func, sigspec=None):
+    if sigspec is None:
+        code = _plain_code(func)
+        if code is not None:
+            return bool(code.co_flags & inspect.CO_VARARGS)
     sigspec, rv = _check_sigspec(sigspec, func, _sigs._has_varargs, func)
     if sigspec is None:
         return rv
-    return any(p.kind == p.VAR_POSITIONAL
+    return any(p.kind is _VAR_POSITIONAL
                for p in sigspec.parameters.values())
 
 
 def has_keywords(func, sigspec=None):
+    if sigspec is None:
+        code = _plain_code(func)
+        if code is not None:
+            return bool(func.__defaults__ or code.co_kwonlyargcount
+                        or code.co_flags & inspect.CO_VARKEYWORDS)
     sigspec, rv = _check_sigspec(sigspec, func, _sigs._has_keywords, func)
     if sigspec is None:
         return rv
-    return any(p.default is not p.empty
-               or p.kind in (p.KEYWORD_ONLY, p.VAR_KEYWORD)
+    return any(p.default is not _empty or p.kind in _KEYWORD_KINDS
                for p in sigspec.parameters.values())
 
 
@@ -1010,9 +1125,9 @@ Is ``func(*args, **kwargs)`` a valid function call?
     False
 
     **Implementation notes**
-    Python 2 relies on ``inspect.getargspec``, which only works for
-    user-defined functions.  Python 3 uses ``inspect.signature``, which
-    works for many more types of callables.
+    This uses ``inspect.signature``, which works for most types of
+    callables.  Plain Python functions are read directly from their code
+    object.
 
     Many builtins in the standard library are also supported.
     """
@@ -1039,9 +1154,9 @@ Can partial(func, *args, **kwargs)(*args2, **kwargs2) be a valid call?
     True
 
     **Implementation notes**
-    Python 2 relies on ``inspect.getargspec``, which only works for
-    user-defined functions.  Python 3 uses ``inspect.signature``, which
-    works for many more types of callables.
+    This uses ``inspect.signature``, which works for most types of
+    callables.  Plain Python functions are read directly from their code
+    object.
 
     Many builtins in the standard library are also supported.
     """
@@ -5,8 +5,15 @@ import operator
 from functools import partial
 from itertools import filterfalse, zip_longest
 from collections.abc import Sequence
+from toolz.functoolz import identity
 from toolz.utils import no_default
 
+try:
+    # Private helper behind ``Counter.update``, implemented in C on CPython
+    from collections import _count_elements
+except ImportError:  # pragma: no cover
+    _count_elements = None
+
 
 __all__ = ('remove', 'accumulate', 'groupby', 'merge_sorted', 'interleave',
            'unique', 'isiterable', 'isdistinct', 'take', 'drop', 'take_nth',
@@ -119,6 +126,14 @@ def merge_sorted(*seqs, **kwargs):
 
     >>> list(merge_sorted([2, 3], [1, 3], key=lambda x: x // 3))
     [2, 1, 3, 3]
+
+    Key-sorted items of several dicts can be streamed this way without
+    building a merged dict
+
+    >>> a = {1: 'one', 3: 'three'}
+    >>> b = {2: 'two', 4: 'four'}
+    >>> list(merge_sorted(sorted(a.items()), sorted(b.items()), key=first))
+    [(1, 'one'), (2, 'two'), (3, 'three'), (4, 'four')]
     """
     if len(seqs) == 0:
         return iter([])
@@ -372,6 +387,10 @@ def first(seq):
     >>> first('ABC')
     'A'
     """
+    # Index tuples and lists directly instead of building an iterator
+    t = type(seq)
+    if (t is tuple or t is list) and seq:
+        return seq[0]
     return next(iter(seq))
 
 
@@ -381,6 +400,9 @@ def second(seq):
     >>> second('ABC')
     'B'
     """
+    t = type(seq)
+    if (t is tuple or t is list) and len(seq) > 1:
+        return seq[1]
     seq = iter(seq)
     next(seq)
     return next(seq)
@@ -501,7 +523,7 @@ def concatv(*seqs):
     See also:
         itertools.chain
     """
-    return concat(seqs)
+    return itertools.chain.from_iterable(seqs)
 
 
 def mapcat(func, seqs):
@@ -511,7 +533,7 @@ def mapcat(func, seqs):
     ...             [["a", "b"], ["c", "d", "e"]]))
     ['A', 'B', 'C', 'D', 'E']
     """
-    return concat(map(func, seqs))
+    return itertools.chain.from_iterable(map(func, seqs))
 
 
 def cons(el, seq):
@@ -529,7 +551,7 @@ def interpose(el, seq):
     >>> list(interpose("a", [1, 2, 3]))
     [1, 'a', 2, 'a', 3]
     """
-    inposed = concat(zip(itertools.repeat(el), seq))
+    inposed = itertools.chain.from_iterable(zip(itertools.repeat(el), seq))
     next(inposed)
     return inposed
 
@@ -544,10 +566,14 @@ def frequencies(seq):
         countby
         groupby
     """
-    d = collections.defaultdict(int)
-    for item in seq:
-        d[item] += 1
-    return dict(d)
+    if _count_elements is None:
+        d = collections.defaultdict(int)
+        for item in seq:
+            d[item] += 1
+        return dict(d)
+    d = {}
+    _count_elements(d, seq)
+    return d
 
 
 def reduceby(key, binop, seq, init=no_default):
@@ -821,6 +847,9 @@ def join(leftkey, leftseq, rightkey, rightseq,
     (Note: If right_default is defined, then unique keys of rightseq
         will also be stored in memory.)
 
+    Only the LEFT sequence is hashed, so when both sequences fit in memory it
+    is usually fastest to pass the smaller one as ``leftseq``.
+
     >>> friends = [('Alice', 'Edith'),
     ...            ('Alice', 'Zhao'),
     ...            ('Edith', 'Alice'),
@@ -879,11 +908,18 @@ def join(leftkey, leftseq, rightkey, rightseq,
 
     if left_default == no_default and right_default == no_default:
         # Inner Join
-        for item in rightseq:
-            key = rightkey(item)
-            if key in d:
-                for left_match in d[key]:
-                    yield (left_match, item)
+        if rightkey is identity:
+            # Skip calling ``identity`` on every item of the streamed side
+            for item in rightseq:
+                if item in d:
+                    for left_match in d[item]:
+                        yield (left_match, item)
+        else:
+            for item in rightseq:
+                key = rightkey(item)
+                if key in d:
+                    for left_match in d[key]:
+                        yield (left_match, item)
     elif left_default != no_default and right_default == no_default:
         # Right Join
         for item in rightseq:
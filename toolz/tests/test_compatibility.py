@@ -8,3 +8,13 @@ def test_compat_warn():
         import toolz.compatibility
         # reload to be sure we warn
         importlib.reload(toolz.compatibility)
+
+
+def test_compat_iteritems():
+    with pytest.warns(DeprecationWarning):
+        import toolz.compatibility
+        importlib.reload(toolz.compatibility)
+    d = {1: 'one', 2: 'two'}
+    assert list(toolz.compatibility.iteritems(d)) == [(1, 'one'), (2, 'two')]
+    assert list(toolz.compatibility.iterkeys(d)) == [1, 2]
+    assert list(toolz.compatibility.itervalues(d)) == ['one', 'two']
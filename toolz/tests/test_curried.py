@@ -1,7 +1,7 @@
 import toolz
 import toolz.curried
 from toolz.curried import (take, first, second, sorted, merge_with, reduce,
-                           merge, operator as cop)
+                           merge, get, operator as cop)
 from collections import defaultdict
 from importlib import import_module
 from operator import add
@@ -15,6 +15,17 @@ def test_first():
     assert first is toolz.itertoolz.first
 
 
+def test_get():
+    assert get(1)((1, 2)) == 2
+    assert get(1)((1, 2, 3)) == 2
+    assert get([0, 1])((1, 2, 3)) == (1, 2)
+    assert get(5, default=None)((1, 2)) is None
+    assert get(default=None)(5)((1, 2)) is None
+    assert get(0, (1, 2)) == 1
+    assert get(5)((1, 2), None) is None
+    assert isinstance(get(1), toolz.curry)
+
+
 def test_merge():
     assert merge(factory=lambda: defaultdict(int))({1: 1}) == {1: 1}
     assert merge({1: 1}) == {1: 1}
@@ -85,7 +96,7 @@ def test_curried_namespace():
     def curry_namespace(ns):
         return {
             name: toolz.curry(f) if should_curry(f) else f
-            for name, f in ns.items() if '__' not in name
+            for name, f in ns.items() if not name.startswith('_')
         }
 
     from_toolz = curry_namespace(vars(toolz))
@@ -34,6 +34,15 @@ class TestDict(object):
         D, kw = self.D, self.kw
         assert merge([D({1: 1, 2: 2}), D({3: 4})], **kw) == D({1: 1, 2: 2, 3: 4})
 
+    def test_merge_copies_first(self):
+        D, kw = self.D, self.kw
+        d = D({1: 1})
+        assert merge(d, D({2: 2}), **kw) == D({1: 1, 2: 2})
+        assert merge(d, D({1: 2}), **kw) == D({1: 2})
+        assert d == D({1: 1})
+        assert merge(iter([d]), **kw) == d
+        assert merge(**kw) == D({})
+
     def test_merge_with(self):
         D, kw = self.D, self.kw
         dicts = D({1: 1, 2: 2}), D({1: 10, 2: 20})
@@ -46,6 +55,16 @@ class TestDict(object):
 
         assert not merge_with(sum)
 
+    def test_merge_with_min_max(self):
+        D, kw = self.D, self.kw
+        dicts = D({1: 1, 2: 20, 3: 3}), D({1: 10, 2: 2}), D({1: 5})
+        assert merge_with(min, *dicts, **kw) == D({1: 1, 2: 2, 3: 3})
+        assert merge_with(max, *dicts, **kw) == D({1: 10, 2: 20, 3: 3})
+        # ties keep the first value seen, as min/max of a list do
+        dicts = D({1: 1.0}), D({1: 1})
+        assert type(merge_with(min, *dicts, **kw)[1]) is float
+        assert type(merge_with(max, *dicts, **kw)[1]) is float
+
     def test_merge_with_iterable_arg(self):
         D, kw = self.D, self.kw
         dicts = D({1: 1, 2: 2}), D({1: 10, 2: 20})
@@ -98,6 +117,12 @@ class TestDict(object):
         assert dissoc(D({"a": 1, "b": 2}), "a", "b", **kw) == D({})
         assert dissoc(D({"a": 1}), "a", **kw) == dissoc(dissoc(D({"a": 1}), "a", **kw), "a", **kw)
 
+        # Missing keys are ignored, and the result is still a new dict
+        d = D({"a": 1, "b": 2})
+        d2 = dissoc(d, "x", "y", "z", **kw)
+        assert d2 == d and d2 is not d
+        assert dissoc(d, "a", "a", "x", "y", "z", **kw) == D({"b": 2})
+
         # Verify immutability:
         d = D({'x': 1})
         oldd = d
@@ -119,6 +144,14 @@ class TestDict(object):
         assert d is oldd
         assert d2 is not oldd
 
+        # Nested levels are copied, not shared or mutated
+        inner = D({"b": 1})
+        d = D({"a": inner, "c": 3})
+        d2 = assoc_in(d, ["a", "x", "y"], 2, **kw)
+        assert d2 == D({"a": D({"b": 1, "x": D({"y": 2})}), "c": 3})
+        assert inner == D({"b": 1})
+        assert d2["a"] is not inner
+
     def test_update_in(self):
         D, kw = self.D, self.kw
         assert update_in(D({"a": 0}), ["a"], inc, **kw) == D({"a": 1})
@@ -268,3 +301,8 @@ def test_merge_with_non_dict_mappings():
 
     assert merge(d) is d or merge(d) == {1: 1}
     assert merge_with(sum, d) == {1: 1}
+
+
+def test_merge_single_dict_copies():
+    d = {1: 1}
+    assert merge(d) == d and merge(d) is not d
@@ -203,6 +203,55 @@ def test_curry_simple():
     assert raises(TypeError, lambda: curry({1: 2}))
 
 
+def test_curry_bind_reuses_signature():
+    def f(x, y, z):
+        return x + y + z
+
+    cf = curry(f)
+    cf1 = cf(1)
+    assert cf._sigspec is not None
+    assert cf1._sigspec is cf._sigspec
+    assert cf1._has_unknown_args is cf._has_unknown_args
+    assert cf1(2)(3) == 6
+    assert raises(TypeError, lambda: cf1(2, 3, 4))
+    assert curry(cf)._sigspec is cf._sigspec
+    assert curry(cf, 1, z=3)._sigspec is cf._sigspec
+    assert cf1._nrequired == cf._nrequired == 3
+
+
+def test_curry_positional_arity():
+    @curry
+    def f(x, y, z=1):
+        if x == 'boom':
+            raise TypeError('inner')
+        return x + y + z
+
+    assert f(1)(2) == 4
+    assert f(1)(2, 3) == 6
+    assert f(1, z=5)(2) == 8
+    assert raises(TypeError, lambda: f('boom', 2))
+    assert raises(TypeError, lambda: f(1, 2, 3, 4))
+    assert f._nrequired == 2
+
+    @curry
+    def g(x, *args):
+        return x
+
+    g(1)
+    assert g._nrequired is None
+
+
+def test_curry_arity_not_trusted_before_call():
+    def g(x, y):
+        return x + y
+
+    cg = curry(g)
+    assert isinstance(cg(1), curry)
+    g.__defaults__ = (10,)
+    # The arity seen on the first call must not skip calling ``g`` now
+    assert cg(1) == 11
+
+
 def test_curry_kwargs():
     def f(a, b, c=10):
         return (a + b) * c
@@ -607,6 +656,8 @@ def test_compose_metadata():
 
     assert hash(composed) == hash(compose(f, h))
     assert hash(composed) != hash(compose(h, f))
+    assert hash(composed) == hash(composed)  # cached after first use
+    assert raises(TypeError, lambda: hash(compose(f, AlwaysEquals())))
 
     bindable = compose(str, lambda x: x*2, lambda x, y=0: int(x) + y)
 
@@ -678,6 +729,10 @@ def test_compose_left():
     for (compose_left_args, args, kw, expected) in generate_compose_left_test_cases():
         assert compose_left(*compose_left_args)(*args, **kw) == expected
 
+    composed = compose_left(inc, double, str)
+    assert composed == compose(str, double, inc)
+    assert hash(composed) == hash(compose(str, double, inc))
+
 
 def test_pipe():
     assert pipe(1, inc) == 2
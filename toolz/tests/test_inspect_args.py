@@ -277,6 +277,35 @@ def test_num_required_args():
     assert num_required_args(map) == 2
     assert num_required_args(dict) is None
 
+    def f(a, b, /, c, d=1, *args, e, f=2, **kwargs):
+        pass
+    assert num_required_args(f) == 3
+
+    @functools.wraps(f)
+    def g(*args, **kwargs):
+        pass
+    assert num_required_args(g) == 3
+
+    g = make_func('x, y, z=1')
+    g.__signature__ = inspect.signature(lambda x: None)
+    assert num_required_args(g) == 1
+
+
+def test_plain_function_introspection():
+    def check(sig):
+        f = make_func(sig)
+        g = make_func(sig)
+        g.__signature__ = inspect.signature(g)  # forces inspect.signature
+        assert num_required_args(f) == num_required_args(g), sig
+        assert has_varargs(f) == has_varargs(g), sig
+        assert has_keywords(f) == has_keywords(g), sig
+        assert is_arity(1, f) == is_arity(1, g), sig
+
+    for sig in ['', 'x', 'x, y', 'x, y=1', 'x, *args', 'x, **kwargs',
+                '*, x', '*, x=1', 'x, *args, y', 'x, /, y', 'x=1, /',
+                'x, y, *args, z=1, **kwargs']:
+        check(sig)
+
 
 def test_has_keywords():
     assert has_keywords(lambda: None) is False
@@ -383,6 +412,22 @@ def test_introspect_curry_py3():
     assert has_keywords(f)
 
 
+def test_curry_signature_cached():
+    f = toolz.curry(make_func('x, y, z=0'), 1)
+    sig = inspect.signature(f)
+    assert list(sig.parameters) == ['y', 'z']
+    assert f.__signature__ is f.__signature__
+    # A new partial application gets its own signature
+    assert list(inspect.signature(f(z=2)).parameters) == ['y', 'z']
+    assert inspect.signature(f(z=2)).parameters['z'].default == 2
+    # The caches are not pickled along with the curry
+    f()
+    assert f._nrequired == 2
+    userdict = dict(f.__reduce__()[1][4])
+    for name in ('_signature', '_sigspec', '_has_unknown_args', '_nrequired'):
+        assert name not in userdict
+
+
 def test_introspect_builtin_modules():
     mods = [builtins, functools, itertools, operator, toolz,
             toolz.functoolz, toolz.itertoolz, toolz.dicttoolz, toolz.recipes]
@@ -161,12 +161,18 @@ def test_first():
     assert first('ABCDE') == 'A'
     assert first((3, 2, 1)) == 3
     assert isinstance(first({0: 'zero', 1: 'one'}), int)
+    assert first([3, 2, 1]) == 3
+    assert raises(StopIteration, lambda: first([]))
+    assert raises(StopIteration, lambda: first(()))
 
 
 def test_second():
     assert second('ABCDE') == 'B'
     assert second((3, 2, 1)) == 2
     assert isinstance(second({0: 'zero', 1: 'one'}), int)
+    assert second([3, 2, 1]) == 2
+    assert raises(StopIteration, lambda: second([1]))
+    assert raises(StopIteration, lambda: second(()))
 
 
 def test_last():
@@ -264,6 +270,17 @@ def test_frequencies():
                                            "o": 4, "n": 1, "p": 1, "t": 1}
 
 
+def test_frequencies_without_count_elements():
+    import toolz.itertoolz
+    count_elements = toolz.itertoolz._count_elements
+    toolz.itertoolz._count_elements = None
+    try:
+        assert frequencies("abca") == {"a": 2, "b": 1, "c": 1}
+        assert type(frequencies([])) is dict
+    finally:
+        toolz.itertoolz._count_elements = count_elements
+
+
 def test_reduceby():
     data = [1, 2, 3, 4, 5]
     iseven = lambda x: x % 2 == 0
@@ -457,6 +474,15 @@ def test_join_missing_element():
     assert result == expected
 
 
+def test_join_toolz_identity():
+    from toolz import identity as toolz_identity
+    names = [(1, 'one'), (2, 'two'), (1, 'uno')]
+    result = list(join(first, names, toolz_identity, [2, 1, 5, 1]))
+    assert result == [((2, 'two'), 2),
+                      ((1, 'one'), 1), ((1, 'uno'), 1),
+                      ((1, 'one'), 1), ((1, 'uno'), 1)]
+
+
 def test_left_outer_join():
     result = set(join(identity, [1, 2], identity, [2, 3], left_default=None))
     expected = {(2, 2), (None, 3)}
@@ -33,6 +33,19 @@ def test_complement():
     assert f(False) == g(False)
 
 
+def test_excepts():
+    f = excepts(ValueError, int, type)
+    g = pickle.loads(pickle.dumps(f))
+    assert f('1') == g('1') == 1
+    assert f('a') is g('a') is ValueError
+    assert (g.exc, g.func, g.handler) == (ValueError, int, type)
+
+    # Older pickles carry the instance ``__dict__`` as their state
+    h = excepts.__new__(excepts)
+    h.__setstate__({'exc': ValueError, 'func': int, 'handler': type})
+    assert (h.exc, h.func, h.handler) == (ValueError, int, type)
+
+
 def test_instanceproperty():
     p = toolz.functoolz.InstanceProperty(bool)
     assert p.__get__(None) is None
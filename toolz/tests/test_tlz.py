@@ -1,4 +1,5 @@
 import toolz
+from toolz.utils import raises
 
 
 def test_tlz():
@@ -55,3 +56,16 @@ def test_tlz():
 
     assert 'tlz' in tlz.__doc__
     assert tlz.curried.__doc__ is not None
+
+
+def test_version():
+    import tlz
+    assert isinstance(toolz.__version__, str)
+    assert tlz.__version__ == toolz.__version__
+    assert raises(AttributeError, lambda: toolz.thisisabadname)
+    try:
+        tlz.thisisabadname
+    except AttributeError as exc:
+        assert "module 'tlz' has" in str(exc)
+    else:
+        assert False, 'tlz.thisisabadname should raise AttributeError'